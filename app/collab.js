@@ -16,7 +16,6 @@ limitations under the License.
 
 module.exports = function(io) {
   const fs = require('fs');
-  const math = require('mathjs');
   const util = require('util');
   const AsyncLock = require('async-lock');
   const lock = new AsyncLock();
@@ -26,6 +25,52 @@ module.exports = function(io) {
     log_file.write(util.format('%i;%s;%j\n', new Date().getTime(), message, json));
   }
 
+  // calls fn(row, col, value) for each stored entry of a coupling matrix
+  // (dense list of rows or a diagonal, block, or sparse coupling object)
+  function forEachCouplingEntry(coupling, fn) {
+    if(Array.isArray(coupling)) {
+      for(let i = 0; i < coupling.length; i++) {
+        for(let j = 0; j < coupling[i].length; j++) {
+          fn(i, j, coupling[i][j]);
+        }
+      }
+    } else if(coupling.type === 'diagonal') {
+      for(let i = 0; i < coupling.data.length; i++) {
+        fn(i, i, coupling.data[i]);
+      }
+    } else if(coupling.type === 'block') {
+      let offset = 0;
+      for(let k = 0; k < coupling.blocks.length; k++) {
+        const block = coupling.blocks[k];
+        for(let i = 0; i < block.length; i++) {
+          for(let j = 0; j < block[i].length; j++) {
+            fn(offset + i, offset + j, block[i][j]);
+          }
+        }
+        offset += block.length;
+      }
+    } else if(coupling.type === 'sparse') {
+      for(let k = 0; k < coupling.data.length; k++) {
+        fn(coupling.rows[k], coupling.cols[k], coupling.data[k]);
+      }
+    } else {
+      throw new Error('unknown coupling type: ' + coupling.type);
+    }
+  }
+
+  // multiplies a coupling matrix (or its transpose) by a vector
+  function multiplyCoupling(coupling, x, transpose) {
+    const y = new Array(x.length).fill(0);
+    forEachCouplingEntry(coupling, function(i, j, value) {
+      if(transpose) {
+        y[j] += value * x[i];
+      } else {
+        y[i] += value * x[j];
+      }
+    });
+    return y;
+  }
+
   let designers = []; // list of current designers
   let admin = null; // current administrator
 
@@ -73,7 +118,7 @@ module.exports = function(io) {
       round = new_round;
       for(let i = 0; i < round.tasks.length; i++) {
         if(typeof round.tasks[i].solution === 'undefined') {
-           round.tasks[i].solution = math.multiply(math.transpose(round.tasks[i].coupling), round.tasks[i].target);
+           round.tasks[i].solution = multiplyCoupling(round.tasks[i].coupling, round.tasks[i].target, true);
         }
       }
       time_start = new Array(round.tasks.length).fill(null);
@@ -174,7 +219,7 @@ module.exports = function(io) {
           j++;
         }
       }
-      task.y = math.multiply(task.coupling, task.x);
+      task.y = multiplyCoupling(task.coupling, task.x, false);
       for(let i = 0; i < task.designers.length; i++) {
         if(!time_start[task.designers[i]]) {
           time_start[task.designers[i]] = time_stamp;
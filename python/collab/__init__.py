@@ -18,5 +18,8 @@ limitations under the License.
 collab: Collaborative Design
 """
 
+from .baseline import BaselineEngine
+from .coupling import parseCoupling, serializeCoupling
 from .model import Session, Round, Task, Action
 from .post import PostProcessor
+from .trajectory import TrajectoryAnalyzer
@@ -0,0 +1,152 @@
+"""
+Copyright 2019 Paul T. Grogan, Stevens Institute of Technology
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from __future__ import division
+import numpy as np
+from scipy.sparse.csgraph import connected_components
+
+class BaselineEngine(object):
+    """
+    Computes optimal-effort baselines for tasks: the straight-line input
+    distance from the initial (zero) input to the solution and a greedy
+    upper bound on the number of single-input moves to reach the error
+    tolerance.
+    """
+    def __init__(self, error_tol=0.05, max_elements=10**6):
+        """
+        Initializes this engine.
+
+        @param error_tol: the error tolerance for solutions
+        @type error_tol: float
+
+        @param max_elements: the maximum number of coupling elements
+            computed in one batch
+        @type max_elements: int
+        """
+        self.error_tol = error_tol
+        self.max_elements = max_elements
+
+    def compute(self, tasks):
+        """
+        Computes baselines for a list of tasks and caches them in each
+        task's baseline_solution and baseline_required attributes.
+
+        Each coupling is split into independent blocks so that diagonal and
+        block couplings are never expanded to dense matrices; blocks of
+        equal size are batched.
+
+        @param tasks: the tasks
+        @type tasks: list(Task)
+        """
+        # baselines for all tasks are stored in flat arrays
+        sizes = np.array([len(t.target) for t in tasks], dtype=int)
+        offsets = np.cumsum(sizes) - sizes
+        solution = np.zeros(np.sum(sizes))
+        required = np.zeros(np.sum(sizes), dtype=bool)
+
+        # group tasks by serialized coupling type and size
+        groups = {}
+        for i, task in enumerate(tasks):
+            type = task.coupling.get('type') if isinstance(task.coupling, dict) else 'dense'
+            groups.setdefault((type, sizes[i]), []).append(i)
+
+        blocks = {} # block size -> list of (positions, couplings, targets)
+        for (type, size), group in groups.items():
+            group = np.array(group, dtype=int)
+            if type == 'dense':
+                # each dense coupling is one block; stack the group at once
+                blocks.setdefault(size, []).append((
+                    offsets[group][:,np.newaxis] + np.arange(size),
+                    np.array([tasks[i].coupling for i in group], dtype=float).reshape(-1, size, size),
+                    np.array([tasks[i].target for i in group], dtype=float).reshape(-1, size)
+                ))
+            elif type == 'diagonal':
+                # each diagonal element is a single-element block
+                blocks.setdefault(1, []).append((
+                    (offsets[group][:,np.newaxis] + np.arange(size)).reshape(-1, 1),
+                    np.array([tasks[i].coupling['data'] for i in group], dtype=float).reshape(-1, 1, 1),
+                    np.array([tasks[i].target for i in group], dtype=float).reshape(-1, 1)
+                ))
+            else:
+                for i in group:
+                    self._addTaskBlocks(blocks, tasks[i], offsets[i])
+
+        for size, items in blocks.items():
+            positions, coupling, target = [np.concatenate(b) for b in zip(*items)]
+            # limit the elements in each batch of computation
+            chunk = max(1, self.max_elements // (size*size))
+            for i in range(0, len(positions), chunk):
+                solution[positions[i:i+chunk]], required[positions[i:i+chunk]] = self._computeBatch(
+                    coupling[i:i+chunk], target[i:i+chunk])
+
+        for task, offset, size in zip(tasks, offsets, sizes):
+            task.baseline_solution = solution[offset:offset+size]
+            task.baseline_required = required[offset:offset+size]
+
+    def _addTaskBlocks(self, blocks, task, offset):
+        """
+        Adds the independent blocks of one task's coupling. Block couplings
+        use their serialized blocks; other couplings are split into
+        connected components.
+        """
+        target = np.asarray(task.target, dtype=float)
+        if task.coupling.get('type') == 'block':
+            start = 0
+            for block in task.coupling['blocks']:
+                index = start + np.arange(len(block))
+                blocks.setdefault(len(block), []).append((
+                    offset + index[np.newaxis,:],
+                    np.array(block, dtype=float)[np.newaxis],
+                    target[index][np.newaxis]
+                ))
+                start += len(block)
+            return
+        coupling = task.getCouplingMatrix()
+        num_blocks, labels = connected_components(coupling, directed=False)
+        order = np.argsort(labels, kind='stable')
+        for index in np.split(order, np.cumsum(np.bincount(labels, minlength=num_blocks))[:-1]):
+            blocks.setdefault(len(index), []).append((
+                offset + index[np.newaxis,:],
+                coupling[index][:,index].toarray()[np.newaxis],
+                target[index][np.newaxis]
+            ))
+
+    def _computeBatch(self, coupling, target):
+        """
+        Computes baselines for stacked blocks of equal size.
+
+        Inputs are set to their solution values greedily in order of
+        decreasing magnitude; the required inputs are the shortest such
+        prefix that brings every error within tolerance. This is an upper
+        bound on the minimum number of moves.
+        """
+        # solve using dot product of coupling transpose and target
+        solution = np.einsum('kji,kj->ki', coupling, target)
+
+        order = np.argsort(-np.abs(solution), axis=1)
+        # output contributions of each input, in greedy order (k x outputs x inputs)
+        contribution = (np.take_along_axis(coupling, order[:,np.newaxis,:], axis=2)
+                        * np.take_along_axis(solution, order, axis=1)[:,np.newaxis,:])
+        # max error with the first m inputs set, for m = 0..n
+        error = np.abs(target[:,:,np.newaxis] - np.concatenate(
+            (np.zeros(target.shape + (1,)), np.cumsum(contribution, axis=2)), axis=2)).max(axis=1)
+        within = error < self.error_tol
+        # if no prefix is within tolerance, all inputs are required
+        num_required = np.where(within.any(axis=1), np.argmax(within, axis=1), order.shape[1])
+
+        required = np.zeros(order.shape, dtype=bool)
+        np.put_along_axis(required, order, np.arange(order.shape[1])[np.newaxis,:] < num_required[:,np.newaxis], axis=1)
+        return solution, required
@@ -0,0 +1,97 @@
+"""
+Copyright 2019 Paul T. Grogan, Stevens Institute of Technology
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+"""
+Serialized forms of the coupling matrix (M). A coupling is either a dense
+list of rows (the original format) or an object with a "type" key:
+
+    {"type": "diagonal", "data": [m_00, m_11, ...]}
+    {"type": "block", "blocks": [[[...], ...], ...]}
+    {"type": "sparse", "size": n, "rows": [...], "cols": [...], "data": [...]}
+
+Block couplings are square dense blocks placed in order along the diagonal;
+sparse couplings list the non-zero entries in coordinate format.
+"""
+
+import numpy as np
+import scipy.sparse as sp
+
+COUPLING_TYPES = ['dense', 'diagonal', 'block', 'sparse']
+
+def parseCoupling(json):
+    """
+    Parses a serialized coupling into a sparse matrix.
+
+    @param json: the serialized coupling
+    @type json: list(list(float)) or dict
+
+    @returns: the coupling matrix
+    @rtype: scipy.sparse.csr_matrix
+    """
+    if not isinstance(json, dict):
+        return sp.csr_matrix(np.array(json, dtype=float))
+    type = json.get('type')
+    if type == 'diagonal':
+        return sp.diags(np.array(json.get('data'), dtype=float), format='csr')
+    elif type == 'block':
+        return sp.block_diag([np.array(b, dtype=float) for b in json.get('blocks')], format='csr')
+    elif type == 'sparse':
+        size = json.get('size')
+        return sp.coo_matrix(
+            (json.get('data'), (json.get('rows'), json.get('cols'))),
+            shape=(size, size), dtype=float
+        ).tocsr()
+    else:
+        raise ValueError('unknown coupling type: {}'.format(type))
+
+def serializeCoupling(matrix, type='dense', block_sizes=None):
+    """
+    Serializes a coupling matrix.
+
+    @param matrix: the coupling matrix
+    @type matrix: numpy.Array(float) or scipy.sparse.spmatrix
+
+    @param type: the serialized type (dense, diagonal, block, or sparse)
+    @type type: str
+
+    @param block_sizes: the size of each diagonal block (block type only)
+    @type block_sizes: list(int)
+
+    @returns: the serialized coupling
+    @rtype: list(list(float)) or dict
+    """
+    if type == 'dense':
+        return (matrix.toarray() if sp.issparse(matrix) else np.asarray(matrix)).tolist()
+    elif type == 'diagonal':
+        return {'type': 'diagonal', 'data': matrix.diagonal().tolist()}
+    elif type == 'block':
+        offsets = np.cumsum([0] + list(block_sizes))
+        matrix = sp.csr_matrix(matrix)
+        return {'type': 'block', 'blocks': [
+            matrix[offsets[i]:offsets[i+1], offsets[i]:offsets[i+1]].toarray().tolist()
+            for i in range(len(block_sizes))
+        ]}
+    elif type == 'sparse':
+        matrix = sp.coo_matrix(matrix)
+        return {
+            'type': 'sparse',
+            'size': matrix.shape[0],
+            'rows': matrix.row.tolist(),
+            'cols': matrix.col.tolist(),
+            'data': matrix.data.tolist()
+        }
+    else:
+        raise ValueError('unknown coupling type: {}'.format(type))
@@ -17,6 +17,9 @@ limitations under the License.
 from __future__ import division
 from scipy.linalg import orth
 import numpy as np
+import scipy.sparse as sp
+
+from .coupling import parseCoupling, serializeCoupling
 
 class Session(object):
     """
@@ -96,11 +99,11 @@ class Round(object):
         )
 
     @staticmethod
-    def generate(name, size, assignments, is_coupled=True, max_time=None, random=np.random):
+    def generate(name, size, assignments, is_coupled=True, is_blocked=False, max_time=None, error_tol=0.05, random=np.random):
         return Round(
             name = name,
             assignments = assignments,
-            tasks = [Task.generate(designers, size, is_coupled=is_coupled, random=random) for designers in assignments],
+            tasks = [Task.generate(designers, size, is_coupled=is_coupled, is_blocked=is_blocked, error_tol=error_tol, random=random) for designers in assignments],
             max_time = max_time*1000 if max_time is not None else None
         )
 
@@ -121,8 +124,8 @@ class Task(object):
         @param num_outputs: the number of outputs per designer
         @type num_outputs: list(int)
 
-        @param coupling: the coupling matrix (M)
-        @type coupling: list(float)
+        @param coupling: the serialized coupling matrix (M)
+        @type coupling: list(list(float)) or dict
 
         @param target: the target vector (y_star)
         @type target: list(float)
@@ -145,6 +148,21 @@ class Task(object):
         self.time_complete = None # set by post-processor
         self.actions = None # set by post-processor
         self.score = None # set by post-processor
+        self.baseline_solution = None # set by baseline engine
+        self.baseline_required = None # set by baseline engine
+
+        self._coupling_matrix = None # parsed on first use
+
+    def getCouplingMatrix(self):
+        """
+        Gets the coupling matrix for this task.
+
+        @returns: the coupling matrix
+        @rtype scipy.sparse.csr_matrix
+        """
+        if self._coupling_matrix is None:
+            self._coupling_matrix = parseCoupling(self.coupling)
+        return self._coupling_matrix
 
     def getSolution(self):
         """
@@ -153,7 +171,7 @@ class Task(object):
         @returns: the solution vector
         @rtype numpy.Array(float)
         """
-        return np.matmul(np.array(self.coupling).T, self.target)
+        return self.getCouplingMatrix().T.dot(np.asarray(self.target, dtype=float))
 
     def getDuration(self):
         """
@@ -176,6 +194,67 @@ class Task(object):
     def getCumulativeErrorNorm(self, designer=None):
         return np.sum([a.getErrorNorm(self, designer) for a in self.actions])
 
+    def getBaselineCountActions(self, designer=None):
+        """
+        Gets a greedy upper bound on the number of single-input moves to
+        solve this task (all outputs within error tolerance). For a designer,
+        counts the moves in the task baseline on that designer's inputs.
+        Requires baselines computed by BaselineEngine.
+
+        @param designer: the designer (optional, default = None)
+        @type designer: int
+
+        @returns: the number of moves
+        @rtype: int
+        """
+        if designer is None:
+            return np.sum(self.baseline_required)
+        else:
+            return np.sum(self.baseline_required[np.array(self.inputs) == designer])
+
+    def getBaselineInputDistanceNorm(self, designer=None):
+        """
+        Gets the straight-line input distance from the initial input to the
+        solution. For a designer, only that designer's inputs are included.
+        Requires baselines computed by BaselineEngine.
+
+        @param designer: the designer (optional, default = None)
+        @type designer: int
+
+        @returns: the input distance
+        @rtype: float
+        """
+        if designer is None:
+            return np.linalg.norm(self.baseline_solution)
+        else:
+            return np.linalg.norm(self.baseline_solution[np.array(self.inputs) == designer])
+
+    def getActionEfficiency(self, designer=None):
+        """
+        Gets the ratio of baseline to observed number of actions.
+
+        @param designer: the designer (optional, default = None)
+        @type designer: int
+
+        @returns: the action efficiency (None if there are no actions)
+        @rtype: float
+        """
+        count = self.getCountActions(designer)
+        return self.getBaselineCountActions(designer)/count if count > 0 else None
+
+    def getDistanceEfficiency(self, designer=None):
+        """
+        Gets the ratio of baseline to observed cumulative input distance.
+
+        @param designer: the designer (optional, default = None)
+        @type designer: int
+
+        @returns: the distance efficiency (None if there are no actions)
+        @rtype: float
+        """
+        distance = self.getCumulativeInputDistanceNorm(designer)
+        return self.getBaselineInputDistanceNorm(designer)/distance if distance > 0 else None
+
     @staticmethod
     def parse(json):
         return Task(
@@ -189,7 +268,7 @@ class Task(object):
         )
 
     @staticmethod
-    def generate(designers, size, inputs=None, outputs=None, is_coupled=True, random=np.random):
+    def generate(designers, size, inputs=None, outputs=None, is_coupled=True, is_blocked=False, error_tol=0.05, random=np.random):
         if inputs is None:
             # try to assign equally among designers
             inputs = [designers[int(i//(size/len(designers)))] for i in range(size)]
@@ -199,22 +278,48 @@ class Task(object):
             outputs = [designers[int(i//(size/len(designers)))] for i in range(size)]
         num_outputs = [np.sum(np.array(outputs) == designer).item() for designer in designers];
 
-        coupling = np.zeros((size, size))
-        if is_coupled:
+        if is_coupled and is_blocked:
+            # blocks are placed in designer order along the diagonal, so each
+            # designer must own one contiguous, equal run of inputs and outputs
+            blocked = [designer for designer, n in zip(designers, num_inputs) for i in range(n)]
+            if list(inputs) != blocked or list(outputs) != blocked:
+                raise ValueError('block coupling requires contiguous and equal input and output assignments')
+            # coupling matrix has an orthonormal block for each designer
+            coupling = sp.block_diag([orth(random.rand(n, n)) for n in num_inputs if n > 0], format='csr')
+            coupling_type = 'block'
+        elif is_coupled:
             # coupling matrix is orthonormal basis of random matrix
-            coupling = orth(random.rand(size, size))
+            coupling = sp.csr_matrix(orth(random.rand(size, size)))
+            coupling_type = 'dense'
         else:
             # coupling matrix has random 1/-1 along diagonal
-            coupling = np.diag(2*random.randint(0,2,size)-1)
-
-        # find a target with no solution values "close" to initial condition
-        solution = np.zeros(size)
-        while np.any(np.abs(solution) <= 0.20):
-            target = orth(2*random.rand(size,1)-1)
+            coupling = sp.diags(2*random.randint(0,2,size)-1, dtype=float, format='csr')
+            coupling_type = 'diagonal'
+
+        # find a target with no solution values "close" to initial condition;
+        # the threshold shrinks for size > 4 because the target is a unit vector
+        # but stays at least twice the error tolerance
+        threshold = max(0.20*min(1, 2/np.sqrt(size)), 2*error_tol)
+        best = None
+        for i in range(1000):
+            candidate = orth(2*random.rand(size,1)-1)
             # solve using dot product of coupling transpose and target
-            solution = np.matmul(coupling.T, target)
-
-        return Task(designers, num_inputs, num_outputs, coupling.tolist(), target[:,0].tolist(), inputs, outputs)
+            solution = coupling.T.dot(candidate)
+            if best is None or np.min(np.abs(solution)) > best:
+                target, best = candidate, np.min(np.abs(solution))
+            if best > threshold:
+                break
+        if best <= threshold:
+            # no unit target passes (likely for large sizes): push the small
+            # solution values of the best target out to the threshold and map
+            # back to a target (coupling matrices are orthogonal)
+            solution = coupling.T.dot(target)
+            solution = np.where(solution < 0, -1, 1)*np.maximum(np.abs(solution), threshold)
+            target = coupling.dot(solution)
+
+        return Task(designers, num_inputs, num_outputs,
+                    serializeCoupling(coupling, coupling_type, block_sizes=[n for n in num_inputs if n > 0]),
+                    target[:,0].tolist(), inputs, outputs)
 
 class Action(object):
     """
@@ -248,9 +353,9 @@ class Action(object):
         """
         # compute error as outputs - targets
         if designer is None:
-            return self.getOutput(task, designer) - task.target
+            return self.getOutput(task) - task.target
         else:
-            return (self.getOutput(task, designer)[np.array(task.outputs) == designer]
+            return (self.getOutput(task, designer)
                     - np.array(task.target)[np.array(task.outputs) == designer])
 
     def getErrorNorm(self, task, designer = None):
@@ -438,7 +543,8 @@ class Action(object):
         @returns: the output vector
         @rtype: numpy.Array(float)
         """
+        output = task.getCouplingMatrix().dot(np.asarray(self.input, dtype=float))
         if designer is None:
-            return np.matmul(task.coupling, self.input)
+            return output
         else:
-            return np.matmul(task.coupling, self.input)[np.array(task.outputs) == designer]
+            return output[np.array(task.outputs) == designer]
@@ -19,6 +19,7 @@ import os.path
 import re
 import numpy as np
 
+from .baseline import BaselineEngine
 from .model import Session, Round, Task, Action
 
 class PostProcessor(object):
@@ -105,3 +106,7 @@ class PostProcessor(object):
                     designer = content.get('designers')[0]
                     task = round.getDesignerTask(designer)
                     task.time_complete = time
+
+        # compute optimal-effort baselines for all tasks
+        BaselineEngine(self.session.error_tol).compute(
+            [t for r in self.session.training + self.session.rounds for t in r.tasks])
@@ -0,0 +1,146 @@
+"""
+Copyright 2019 Paul T. Grogan, Stevens Institute of Technology
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from __future__ import division
+import numpy as np
+import scipy.sparse as sp
+
+class TrajectoryAnalyzer(object):
+    """
+    Analyzes the error trajectories of a set of post-processed tasks. The
+    actions of all tasks are flattened into one array so that curves and
+    features are computed for every task at once. Tasks without actions
+    (e.g. rounds that never ran) have all-NaN results.
+    """
+    def __init__(self, tasks, max_times=None):
+        """
+        Initializes this analyzer.
+
+        @param tasks: the post-processed tasks
+        @type tasks: list(Task)
+
+        @param max_times: the time used to normalize each task, usually the
+            round maximum time (milliseconds); None leaves times unnormalized
+        @type max_times: list(number)
+        """
+        self.tasks = tasks
+        if max_times is None:
+            max_times = [None]*len(tasks)
+        max_times = np.array([m if m else 1 for m in max_times], dtype=float)
+
+        # number of actions and index of the first action of each task
+        self.counts = np.array([len(t.actions) if t.actions else 0 for t in tasks], dtype=int)
+        self.starts = np.cumsum(self.counts) - self.counts
+        self.action_task = np.repeat(np.arange(len(tasks)), self.counts)
+
+        # elapsed time of each action (see Action.getElapsedTime), normalized
+        time_starts = np.array([t.time_start if t.time_start is not None and t.time_start >= 0
+                                else t.actions[0].time if t.actions else 0 for t in tasks], dtype=float)
+        times = np.array([a.time for t in tasks if t.actions for a in t.actions], dtype=float)
+        self.times = (times - time_starts[self.action_task]) / max_times[self.action_task]
+
+        self.errors = self._getErrorNorms()
+
+    def _getErrorNorms(self):
+        """
+        Gets the error norm after each action (see Action.getErrorNorm).
+
+        Each action is placed in its task's columns of a block-diagonal
+        system so all outputs are computed with one sparse product.
+        """
+        if len(self.action_task) == 0:
+            return np.zeros(0)
+        sizes = np.array([len(t.target) for t in self.tasks], dtype=int)
+        row_sizes = sizes[self.action_task]
+        row_starts = np.cumsum(row_sizes) - row_sizes
+        col_starts = np.cumsum(sizes) - sizes
+        rows = np.repeat(np.arange(len(row_sizes)), row_sizes)
+        cols = col_starts[self.action_task][rows] + np.arange(len(rows)) - row_starts[rows]
+        shape = (len(row_sizes), np.sum(sizes))
+
+        inputs = sp.csr_matrix((np.concatenate(
+            [np.asarray(a.input, dtype=float) for t in self.tasks if t.actions for a in t.actions]
+        ), (rows, cols)), shape=shape)
+        targets = sp.csr_matrix((np.concatenate(
+            [np.tile(np.asarray(t.target, dtype=float), n) for t, n in zip(self.tasks, self.counts)]
+        ), (rows, cols)), shape=shape)
+        coupling = sp.block_diag([t.getCouplingMatrix() for t in self.tasks], format='csr')
+
+        error = inputs.dot(coupling.T) - targets
+        return np.sqrt(np.asarray(error.multiply(error).sum(axis=1))).ravel()
+
+    def getErrorCurves(self, grid):
+        """
+        Gets the error norm of each task resampled on a common time grid. The
+        error holds its value between actions; grid times before a task's
+        first action are NaN.
+
+        @param grid: the (normalized) time grid
+        @type grid: numpy.Array(float)
+
+        @returns: the error norms (tasks x grid)
+        @rtype: numpy.Array(float)
+        """
+        grid = np.asarray(grid, dtype=float)
+        if len(self.times) == 0:
+            return np.full((len(self.tasks), len(grid)), np.nan)
+        # offset each task's times by a span wider than all times so that a
+        # single sorted search locates the latest action for every task
+        lower = min(np.min(self.times), np.min(grid))
+        span = max(np.max(self.times), np.max(grid)) - lower + 1
+        offsets = np.arange(len(self.tasks))*span - lower
+        keys = self.times + offsets[self.action_task]
+        index = np.searchsorted(keys, grid[np.newaxis,:] + offsets[:,np.newaxis], side='right') - 1
+        valid = (index >= self.starts[:,np.newaxis]) & (self.counts[:,np.newaxis] > 0)
+        return np.where(valid, self.errors[np.maximum(index, 0)], np.nan)
+
+    def getTimesToThreshold(self, tolerances):
+        """
+        Gets the first (normalized) time that the error norm of each task is
+        within each tolerance. Tasks that never reach a tolerance are NaN.
+
+        @param tolerances: the error norm tolerances
+        @type tolerances: list(float)
+
+        @returns: the times to threshold (tasks x tolerances)
+        @rtype: numpy.Array(float)
+        """
+        tolerances = np.asarray(tolerances, dtype=float)
+        times = np.where(self.errors[:,np.newaxis] <= tolerances[np.newaxis,:],
+                         self.times[:,np.newaxis], np.inf)
+        first = np.full((len(self.tasks), len(tolerances)), np.inf)
+        # reduceat is undefined for empty slices, so skip tasks without actions
+        nonempty = self.counts > 0
+        if np.any(nonempty):
+            first[nonempty] = np.minimum.reduceat(times, self.starts[nonempty], axis=0)
+        return np.where(np.isinf(first), np.nan, first)
+
+    @staticmethod
+    def fromRounds(rounds):
+        """
+        Creates an analyzer for all tasks in a list of rounds, normalizing
+        times by the round maximum time.
+
+        @param rounds: the post-processed rounds
+        @type rounds: list(Round)
+
+        @returns: the analyzer
+        @rtype: TrajectoryAnalyzer
+        """
+        return TrajectoryAnalyzer(
+            tasks = [t for r in rounds for t in r.tasks],
+            max_times = [r.max_time for r in rounds for t in r.tasks]
+        )
@@ -62,4 +62,5 @@ for seed in range(NUMBER_EXPERIMENTS):
 
     # write experiment files to the server app directory
     with open(os.path.join('..', 'app', 'experiment{:03d}.json'.format(seed+1)), 'w') as out_file:
-        json.dump(session, out_file, default=lambda o: o.__dict__)
+        # skip private (cached) attributes when serializing
+        json.dump(session, out_file, default=lambda o: {k: v for k, v in o.__dict__.items() if not k.startswith('_')})
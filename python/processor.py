@@ -32,12 +32,15 @@ def main(log_file, json_file):
     pp = PostProcessor(log_file, json_file)
     # print header
     print(pp.session.name)
-    print("{0:>5},{4:>10},{1:>25},{2:>3},{3:>3},{5:>10},{6:>10},{7:>10},{8:>10},{9:>10},{10:>10}".format(
-        "Order", "Name", "N", "n", "Designers", "Score", "Time (s)", "Actions", "Productive", "Distance", "Error"))
+    print("{0:>5},{4:>10},{1:>25},{2:>3},{3:>3},{5:>10},{6:>10},{7:>10},{8:>10},{9:>10},{10:>10},{11:>10},{12:>10}".format(
+        "Order", "Name", "N", "n", "Designers", "Score", "Time (s)", "Actions", "Productive", "Distance", "Error",
+        "Action Eff", "Dist Eff"))
     # print rows for each task
     for i, round in enumerate(pp.session.rounds):
         for task in round.tasks:
-            print("{0:>5},{4:>10},{1:>25},{2:>3},{3:>3},{5:>10},{6:>10},{7:>10},{8:>10},{9:>10},{10:>10}".format(
+            action_efficiency = task.getActionEfficiency()
+            distance_efficiency = task.getDistanceEfficiency()
+            print("{0:>5},{4:>10},{1:>25},{2:>3},{3:>3},{5:>10},{6:>10},{7:>10},{8:>10},{9:>10},{10:>10},{11:>10},{12:>10}".format(
                 i+1,
                 round.name.replace(' (Individual)', '').replace(' (Pair)', ''),
                 sum(task.num_inputs),
@@ -48,7 +51,9 @@ def main(log_file, json_file):
                 "{:10d}".format(task.getCountActions()),
                 "{:10d}".format(task.getCountProductiveActions()),
                 "{:10.2f}".format(task.getCumulativeInputDistanceNorm()),
-                "{:10.2f}".format(task.getCumulativeErrorNorm())
+                "{:10.2f}".format(task.getCumulativeErrorNorm()),
+                "{:10.2f}".format(action_efficiency) if action_efficiency is not None else '',
+                "{:10.2f}".format(distance_efficiency) if distance_efficiency is not None else ''
             ))
 
 if __name__ == '__main__':
@@ -0,0 +1,142 @@
+"""
+Copyright 2019 Paul T. Grogan, Stevens Institute of Technology
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from __future__ import division
+import itertools
+import unittest
+import numpy as np
+
+from collab import Round, Task, Action, BaselineEngine, serializeCoupling
+
+def generateTasks(num_rounds, seed=0):
+    """
+    Generates tasks with dense, diagonal, block, and sparse couplings.
+    """
+    random = np.random.RandomState(seed)
+    tasks = []
+    for i in range(num_rounds):
+        round = Round.generate(name='Round {}'.format(i), size=random.randint(1,7),
+                               assignments=[[0,1],[2,3]], is_coupled=bool(i%4),
+                               is_blocked=(i%4 == 2), random=random)
+        for task in round.tasks:
+            if i%4 == 3:
+                task = Task(task.designers, task.num_inputs, task.num_outputs,
+                            serializeCoupling(task.getCouplingMatrix(), 'sparse'),
+                            task.target, task.inputs, task.outputs)
+            tasks.append(task)
+    return tasks
+
+def getBlocks(task):
+    """
+    Gets the input indices of each independent block of a task, one task at
+    a time.
+    """
+    size = len(task.target)
+    if isinstance(task.coupling, list):
+        return [list(range(size))]
+    elif task.coupling['type'] == 'block':
+        sizes = [len(b) for b in task.coupling['blocks']]
+        return [list(range(s - n, s)) for s, n in zip(np.cumsum(sizes), sizes)]
+    # merge indices linked by any non-zero coupling value
+    matrix = task.getCouplingMatrix().toarray()
+    blocks = []
+    for i in range(size):
+        linked = [b for b in blocks if any(matrix[i,j] != 0 or matrix[j,i] != 0 for j in b)]
+        blocks = [b for b in blocks if b not in linked] + [sorted(sum(linked, [i]))]
+    return blocks
+
+def getRequired(task, error_tol):
+    """
+    Gets the inputs set by the greedy baseline, one task and block at a time.
+    """
+    matrix = task.getCouplingMatrix().toarray()
+    target = np.array(task.target)
+    solution = task.getSolution()
+    required = np.zeros(len(target), dtype=bool)
+    for block in getBlocks(task):
+        order = [block[i] for i in np.argsort(-np.abs(solution[block]), kind='stable')]
+        for count in range(len(block) + 1):
+            input = np.zeros(len(target))
+            input[order[:count]] = solution[order[:count]]
+            if all(abs(e) < error_tol for e in (np.matmul(matrix, input) - target)[block]):
+                break
+        required[order[:count]] = True
+    return required
+
+def getMinimumCount(task, error_tol):
+    """
+    Gets the minimum number of inputs to set by brute force.
+    """
+    matrix = task.getCouplingMatrix().toarray()
+    solution = task.getSolution()
+    size = len(solution)
+    for count in range(size + 1):
+        for inputs in itertools.combinations(range(size), count):
+            input = np.zeros(size)
+            input[list(inputs)] = solution[list(inputs)]
+            if np.all(np.abs(np.matmul(matrix, input) - task.target) < error_tol):
+                return count
+    return size
+
+class BaselineEngineTestCase(unittest.TestCase):
+    def test_matches_tasks(self):
+        tasks = generateTasks(200)
+        for error_tol in [0.05, 0.3]:
+            # a small maximum forces many batches per block size
+            BaselineEngine(error_tol, max_elements=20).compute(tasks)
+            for task in tasks:
+                self.assertTrue(np.allclose(task.baseline_solution, task.getSolution()))
+                self.assertTrue(np.array_equal(task.baseline_required, getRequired(task, error_tol)))
+
+    def test_batch_size(self):
+        tasks = generateTasks(50)
+        BaselineEngine(0.3).compute(tasks)
+        required = [t.baseline_required.copy() for t in tasks]
+        BaselineEngine(0.3, max_elements=1).compute(tasks)
+        for task, req in zip(tasks, required):
+            self.assertTrue(np.array_equal(task.baseline_required, req))
+
+    def test_upper_bound(self):
+        tasks = generateTasks(100)
+        BaselineEngine(0.3).compute(tasks)
+        for task in tasks:
+            self.assertGreaterEqual(task.getBaselineCountActions(), getMinimumCount(task, 0.3))
+
+    def test_designers(self):
+        tasks = generateTasks(20)
+        BaselineEngine(0.3).compute(tasks)
+        for task in tasks:
+            self.assertEqual(sum(task.getBaselineCountActions(d) for d in task.designers),
+                             task.getBaselineCountActions())
+            self.assertAlmostEqual(sum(task.getBaselineInputDistanceNorm(d)**2 for d in task.designers),
+                                   task.getBaselineInputDistanceNorm()**2)
+
+    def test_efficiency(self):
+        tasks = generateTasks(20)
+        BaselineEngine(0.05).compute(tasks)
+        for task in tasks:
+            solution = task.getSolution()
+            task.actions = [Action(time=0, input=np.zeros(len(solution)))]
+            self.assertIsNone(task.getActionEfficiency())
+            self.assertIsNone(task.getDistanceEfficiency())
+            # move halfway, overshoot, then move to the solution
+            for input in [solution/2, 2*solution, solution]:
+                task.actions.append(Action(time=0, input=input))
+            self.assertAlmostEqual(task.getActionEfficiency(), task.getBaselineCountActions()/3)
+            self.assertAlmostEqual(task.getDistanceEfficiency(), 1/3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+"""
+Copyright 2019 Paul T. Grogan, Stevens Institute of Technology
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from __future__ import division
+import unittest
+import numpy as np
+import scipy.sparse as sp
+
+from collab import parseCoupling, serializeCoupling
+
+class CouplingTestCase(unittest.TestCase):
+    def setUp(self):
+        random = np.random.RandomState(0)
+        self.dense = random.rand(5, 5)
+        self.diagonal = np.diag(random.rand(5))
+        self.block = sp.block_diag([random.rand(2, 2), random.rand(3, 3)]).toarray()
+        self.sparse = np.where(random.rand(5, 5) < 0.3, random.rand(5, 5), 0)
+
+    def assertRoundTrip(self, matrix, type, **kwargs):
+        json = serializeCoupling(sp.csr_matrix(matrix), type, **kwargs)
+        self.assertTrue(np.array_equal(parseCoupling(json).toarray(), matrix))
+        return json
+
+    def test_dense(self):
+        json = self.assertRoundTrip(self.dense, 'dense')
+        self.assertEqual(json, self.dense.tolist())
+        self.assertTrue(np.array_equal(
+            parseCoupling(serializeCoupling(self.dense, 'dense')).toarray(), self.dense))
+
+    def test_diagonal(self):
+        json = self.assertRoundTrip(self.diagonal, 'diagonal')
+        self.assertEqual(json, {'type': 'diagonal', 'data': np.diag(self.diagonal).tolist()})
+
+    def test_block(self):
+        json = self.assertRoundTrip(self.block, 'block', block_sizes=[2, 3])
+        self.assertEqual([len(b) for b in json['blocks']], [2, 3])
+
+    def test_sparse(self):
+        json = self.assertRoundTrip(self.sparse, 'sparse')
+        self.assertEqual(len(json['data']), np.count_nonzero(self.sparse))
+        self.assertEqual(json['size'], 5)
+
+    def test_unknown(self):
+        with self.assertRaises(ValueError):
+            parseCoupling({'type': 'unknown'})
+        with self.assertRaises(ValueError):
+            serializeCoupling(self.dense, 'unknown')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+"""
+Copyright 2019 Paul T. Grogan, Stevens Institute of Technology
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from __future__ import division
+import json
+import unittest
+import numpy as np
+
+from collab import Task, Action, parseCoupling
+
+def serialize(task):
+    """
+    Serializes and parses a task as the generator and post-processor do.
+    """
+    return Task.parse(json.loads(json.dumps(
+        {k: v for k, v in task.__dict__.items() if not k.startswith('_')})))
+
+class TaskGenerateTestCase(unittest.TestCase):
+    def test_coupling_types(self):
+        random = np.random.RandomState(0)
+        self.assertIsInstance(Task.generate([0,1], 4, random=random).coupling, list)
+        self.assertEqual(Task.generate([0,1], 4, is_coupled=False, random=random).coupling['type'], 'diagonal')
+        self.assertEqual(Task.generate([0,1], 4, is_blocked=True, random=random).coupling['type'], 'block')
+
+    def test_blocked(self):
+        random = np.random.RandomState(0)
+        task = Task.generate([0,1], 5, is_blocked=True, random=random)
+        self.assertEqual([len(b) for b in task.coupling['blocks']], task.num_inputs)
+        matrix = parseCoupling(task.coupling).toarray()
+        # no coupling across designer partitions
+        inputs = np.array(task.inputs)
+        self.assertTrue(np.all(matrix[np.not_equal.outer(inputs, inputs)] == 0))
+
+    def test_blocked_empty_designer(self):
+        random = np.random.RandomState(0)
+        task = Task.generate([0,1], 1, is_blocked=True, random=random)
+        self.assertEqual(task.num_inputs, [1, 0])
+        self.assertEqual(len(task.coupling['blocks']), 1)
+        self.assertEqual(serialize(task).getCouplingMatrix().shape, (1, 1))
+
+    def test_blocked_assignments(self):
+        with self.assertRaises(ValueError):
+            Task.generate([0,1], 4, inputs=[0,1,0,1], outputs=[0,1,0,1], is_blocked=True)
+        with self.assertRaises(ValueError):
+            Task.generate([0,1], 4, outputs=[0,0,0,1], is_blocked=True)
+
+    def test_large_solution(self):
+        random = np.random.RandomState(0)
+        for kwargs in [{'is_coupled': False}, {'is_coupled': True}, {'is_blocked': True}]:
+            task = Task.generate([0,1,2,3], 100, random=random, **kwargs)
+            self.assertTrue(np.all(np.abs(task.getSolution()) > 0.05))
+            self.assertTrue(np.allclose(task.getCouplingMatrix().dot(task.getSolution()), task.target))
+
+class ActionTestCase(unittest.TestCase):
+    def setUp(self):
+        random = np.random.RandomState(0)
+        self.tasks = [serialize(Task.generate([0,1], 4, random=random, **kwargs))
+                      for kwargs in [{}, {'is_coupled': False}, {'is_blocked': True}]]
+        self.input = random.rand(4)
+
+    def test_output(self):
+        for task in self.tasks:
+            matrix = np.array(parseCoupling(task.coupling).toarray())
+            action = Action(time=0, input=self.input)
+            self.assertTrue(np.allclose(action.getOutput(task), np.matmul(matrix, self.input)))
+            self.assertTrue(np.allclose(task.getSolution(), np.matmul(matrix.T, task.target)))
+
+    def test_designer_error(self):
+        for task in self.tasks:
+            action = Action(time=0, input=self.input)
+            error = action.getError(task)
+            for designer in task.designers:
+                outputs = np.array(task.outputs) == designer
+                self.assertTrue(np.allclose(action.getOutput(task, designer), action.getOutput(task)[outputs]))
+                self.assertTrue(np.allclose(action.getError(task, designer), error[outputs]))
+
+if __name__ == '__main__':
+    unittest.main()
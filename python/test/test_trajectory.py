@@ -0,0 +1,108 @@
+"""
+Copyright 2019 Paul T. Grogan, Stevens Institute of Technology
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from __future__ import division
+import unittest
+import numpy as np
+
+from collab import Round, Action, TrajectoryAnalyzer
+
+GRID = np.linspace(0, 1.2, 61)
+TOLERANCES = [0.5, 0.1, 0.05]
+
+def generateRounds(num_rounds, seed=0):
+    """
+    Generates rounds with simulated actions that move toward the solution.
+    """
+    random = np.random.RandomState(seed)
+    rounds = []
+    for i in range(num_rounds):
+        round = Round.generate(name='Round {}'.format(i), size=random.randint(1,6),
+                               assignments=[[0,1],[2,3]], is_coupled=bool(i%3),
+                               is_blocked=(i%3 == 2), max_time=300, random=random)
+        for task in round.tasks:
+            solution = task.getSolution()
+            input = np.zeros(len(solution))
+            task.time_start = 1000
+            task.actions = [Action(time=900, input=input.copy())]
+            time = task.time_start
+            for j in range(random.randint(0,30)):
+                time += random.randint(1,20000)
+                input = input + (solution - input)*random.rand(len(input))
+                task.actions.append(Action(time=time, input=input.copy()))
+        rounds.append(round)
+    return rounds
+
+def getErrorCurve(round, task):
+    """
+    Gets the step-interpolated error curve of a task, action by action.
+    """
+    times = np.array([a.getElapsedTime(task) for a in task.actions])/round.max_time
+    errors = np.array([a.getErrorNorm(task) for a in task.actions])
+    return [errors[times <= t][-1] if np.any(times <= t) else np.nan for t in GRID]
+
+def getTimesToThreshold(round, task):
+    """
+    Gets the times to threshold of a task, action by action.
+    """
+    times = np.array([a.getElapsedTime(task) for a in task.actions])/round.max_time
+    errors = np.array([a.getErrorNorm(task) for a in task.actions])
+    return [times[errors <= tol][0] if np.any(errors <= tol) else np.nan for tol in TOLERANCES]
+
+class TrajectoryAnalyzerTestCase(unittest.TestCase):
+    def test_matches_actions(self):
+        rounds = generateRounds(50)
+        analyzer = TrajectoryAnalyzer.fromRounds(rounds)
+        self.assertTrue(np.allclose(
+            analyzer.getErrorCurves(GRID),
+            [getErrorCurve(r, t) for r in rounds for t in r.tasks],
+            equal_nan=True))
+        self.assertTrue(np.allclose(
+            analyzer.getTimesToThreshold(TOLERANCES),
+            [getTimesToThreshold(r, t) for r in rounds for t in r.tasks],
+            equal_nan=True))
+
+    def test_tasks_without_actions(self):
+        rounds = generateRounds(5)
+        # first and last rounds never ran
+        for task in rounds[0].tasks + rounds[-1].tasks:
+            task.time_start = -1 if task is rounds[0].tasks[0] else None
+            task.actions = None if task is rounds[0].tasks[0] else []
+        analyzer = TrajectoryAnalyzer.fromRounds(rounds)
+        curves = analyzer.getErrorCurves(GRID)
+        times = analyzer.getTimesToThreshold(TOLERANCES)
+        for i, task in enumerate(t for r in rounds for t in r.tasks):
+            if task.actions:
+                self.assertFalse(np.all(np.isnan(curves[i])))
+            else:
+                self.assertTrue(np.all(np.isnan(curves[i])))
+                self.assertTrue(np.all(np.isnan(times[i])))
+        ran = rounds[1:-1]
+        self.assertTrue(np.allclose(
+            times[len(rounds[0].tasks):-len(rounds[-1].tasks)],
+            [getTimesToThreshold(r, t) for r in ran for t in r.tasks],
+            equal_nan=True))
+
+    def test_no_actions(self):
+        rounds = generateRounds(2)
+        for task in rounds[0].tasks + rounds[1].tasks:
+            task.actions = None
+        analyzer = TrajectoryAnalyzer.fromRounds(rounds)
+        self.assertTrue(np.all(np.isnan(analyzer.getErrorCurves(GRID))))
+        self.assertTrue(np.all(np.isnan(analyzer.getTimesToThreshold(TOLERANCES))))
+
+if __name__ == '__main__':
+    unittest.main()